@@ -7,26 +7,18 @@ It demonstrates both regular and memory-constrained execution patterns.
 """
 
 import asyncclick as click
-from src import (
-    logger,
-    ExecutionHandler,
-    MemoryConstrainedExecutionHandler,
-    SafetyMarginMemoryPolicyAdapter,
-    FileSizeMemoryEstimatorAdapter,
-    DataSizeMemoryEstimatorAdapter,
-)
-from src.core.example_functions import read_file_to_string, create_large_string
+from src import logger
 
 
 def example_worker_function(task_id: int) -> str:
     """Example function that runs in a worker process."""
-    logger.info(f"Worker process executing task {task_id}")
+    logger.info("Worker process executing task %d", task_id)
     return f"Task {task_id} completed in worker process"
 
 
 def cpu_intensive_task(n: int) -> int:
     """CPU intensive task that benefits from worker processes."""
-    logger.info(f"Computing factorial of {n} in worker process")
+    logger.info("Computing factorial of %d in worker process", n)
     result = 1
     for i in range(1, n + 1):
         result *= i
@@ -58,7 +50,17 @@ async def main(n_workers: int, handler_type: str, memory_safety_margin: float):
         f"🚀 Starting execution-handler with {n_workers} workers using {handler_type} handler"
     )
 
+    # Backends are imported only once we know which one is needed, so the
+    # regular handler doesn't load psutil and the memory adapters
     if handler_type == "memory-constrained":
+        from src import (
+            MemoryConstrainedExecutionHandler,
+            SafetyMarginMemoryPolicyAdapter,
+            FileSizeMemoryEstimatorAdapter,
+            DataSizeMemoryEstimatorAdapter,
+        )
+        from src.core.example_functions import read_file_to_string, create_large_string
+
         # Use memory-constrained execution handler with ports/adapters architecture
         memory_policy = SafetyMarginMemoryPolicyAdapter(
             safety_margin=memory_safety_margin
@@ -70,24 +72,26 @@ async def main(n_workers: int, handler_type: str, memory_safety_margin: float):
             # Display memory information
             memory_info = handler.get_memory_info()
             logger.info(
-                f"💾 Memory info: {memory_info['available'] // (1024**2)}MB available, "
-                f"{memory_info['safe_available'] // (1024**2)}MB safe to use "
+                f"💾 Memory info: {memory_info['available'] >> 20}MB available, "
+                f"{memory_info['safe_available'] >> 20}MB safe to use "
                 f"({memory_safety_margin:.0%} safety margin)"
             )
 
             # Demonstrate memory-constrained file operations
             logger.info("📁 Testing memory-constrained file operations...")
-            try:
-                # Create a test file in a writable location
-                import tempfile
-                import os
+            # Create a test file in a writable location with a single binary write
+            import tempfile
+            import os
 
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-                    test_file = f.name
-                    f.write("Memory-constrained execution test file.\n" * 1000)
+            with tempfile.NamedTemporaryFile(
+                mode="wb", suffix=".txt", delete=False
+            ) as f:
+                test_file = f.name
+                f.write(b"Memory-constrained execution test file.\n" * 1000)
 
+            try:
                 # Use file size memory estimator
-                file_estimator = FileSizeMemoryEstimatorAdapter(multiplier=2.0)
+                file_estimator = FileSizeMemoryEstimatorAdapter()
 
                 # Try to read the file with memory checking
                 result = handler.execute_with_memory_check(
@@ -107,12 +111,13 @@ async def main(n_workers: int, handler_type: str, memory_safety_margin: float):
                 )
                 logger.info(f"✅ Large string created: {len(large_string)} characters")
 
-                # Clean up test file
-                os.remove(test_file)
-
             except MemoryError as e:
                 logger.warning(f"⚠️  Memory constraint prevented execution: {e}")
 
+            finally:
+                # Clean up test file
+                os.remove(test_file)
+
             # Regular batch processing still works with memory checks
             logger.info("⚡ Running batch processing with memory awareness...")
             batch_args = [(i,) for i in range(1, 4)]  # 3 tasks
@@ -122,6 +127,8 @@ async def main(n_workers: int, handler_type: str, memory_safety_margin: float):
                 logger.info(f"   - {result}")
 
     else:
+        from src import ExecutionHandler
+
         # Use regular execution handler without memory constraints
         with ExecutionHandler(n_workers) as handler:
             # Single function execution
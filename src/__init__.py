@@ -1,48 +1,47 @@
 """Execution Handler - Memory-constrained function execution utility."""
 
-# Infrastructure
-from .infrastructure import Logger, logger, SingletonMeta, Singleton
+import importlib
 
-# Application layer
-from .application import ExecutionHandler
-
-# Core domain logic
-from .core import MemoryConstrainedExecutionHandler
-
-# Ports (interfaces)
-from .ports import (
-    MemoryEstimatorPort,
-    MemoryMonitorPort,
-    MemoryPolicyPort,
-    ExecutionDecisionPort,
-    MemoryInfo,
-)
-
-# Adapters (implementations)
-from .adapters import (
-    PsutilMemoryMonitorAdapter,
-    SafetyMarginMemoryPolicyAdapter,
-    LoggerExecutionDecisionAdapter,
-    FileSizeMemoryEstimatorAdapter,
-    DataSizeMemoryEstimatorAdapter,
-    FixedMemoryEstimatorAdapter,
-    CustomMemoryEstimatorAdapter,
-)
-
-# Core utilities
-from .core.memory_estimators import (
-    FileSizeMemoryEstimator,
-    DataSizeMemoryEstimator,
-    ListSizeMemoryEstimator,
-    CustomMemoryEstimator,
-)
-from .core.example_functions import (
-    read_file_to_string,
-    process_large_list,
-    create_large_string,
-    memory_intensive_operation,
-    safe_file_operation,
-)
+# Public names are resolved lazily on first access (PEP 562), so importing the
+# package doesn't pull in psutil, mpire and every adapter up front.
+_LAZY = {
+    # Infrastructure
+    "Logger": ".infrastructure",
+    "logger": ".infrastructure",
+    "SingletonMeta": ".infrastructure",
+    "Singleton": ".infrastructure",
+    # Application layer
+    "ExecutionHandler": ".application",
+    "shutdown_all": ".application",
+    # Core domain logic
+    "MemoryConstrainedExecutionHandler": ".core",
+    # Ports (interfaces)
+    "MemoryEstimatorPort": ".ports",
+    "MemoryMonitorPort": ".ports",
+    "MemoryPolicyPort": ".ports",
+    "ExecutionDecisionPort": ".ports",
+    "MemoryInfo": ".ports",
+    "MemoryCheckResult": ".ports",
+    # Adapters (implementations)
+    "PsutilMemoryMonitorAdapter": ".adapters",
+    "SafetyMarginMemoryPolicyAdapter": ".adapters",
+    "LoggerExecutionDecisionAdapter": ".adapters",
+    "FileSizeMemoryEstimatorAdapter": ".adapters",
+    "DataSizeMemoryEstimatorAdapter": ".adapters",
+    "FixedMemoryEstimatorAdapter": ".adapters",
+    "CustomMemoryEstimatorAdapter": ".adapters",
+    # Core utilities
+    "FileSizeMemoryEstimator": ".core.memory_estimators",
+    "DataSizeMemoryEstimator": ".core.memory_estimators",
+    "ListSizeMemoryEstimator": ".core.memory_estimators",
+    "CustomMemoryEstimator": ".core.memory_estimators",
+    "read_file_to_string": ".core.example_functions",
+    "process_large_list": ".core.example_functions",
+    "create_large_string": ".core.example_functions",
+    "create_large_bytes": ".core.example_functions",
+    "memory_intensive_operation": ".core.example_functions",
+    "safe_file_operation": ".core.example_functions",
+}
 
 __all__ = [
     "Logger",
@@ -50,12 +49,14 @@ __all__ = [
     "SingletonMeta",
     "Singleton",
     "ExecutionHandler",
+    "shutdown_all",
     "MemoryConstrainedExecutionHandler",
     "MemoryEstimatorPort",
     "MemoryMonitorPort",
     "MemoryPolicyPort",
     "ExecutionDecisionPort",
     "MemoryInfo",
+    "MemoryCheckResult",
     "PsutilMemoryMonitorAdapter",
     "SafetyMarginMemoryPolicyAdapter",
     "LoggerExecutionDecisionAdapter",
@@ -70,6 +71,23 @@ __all__ = [
     "read_file_to_string",
     "process_large_list",
     "create_large_string",
+    "create_large_bytes",
     "memory_intensive_operation",
     "safe_file_operation",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its defining module on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,9 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence
+
 import psutil
 from ..ports import (
     MemoryMonitorPort,
@@ -5,6 +11,7 @@ from ..ports import (
     MemoryPolicyPort,
     ExecutionDecisionPort,
     MemoryInfo,
+    MemoryCheckResult,
 )
 from ..infrastructure.logger import logger
 
@@ -12,29 +19,58 @@ from ..infrastructure.logger import logger
 class PsutilMemoryMonitorAdapter(MemoryMonitorPort):
     """Adapter for psutil-based memory monitoring."""
 
+    __slots__ = ("ttl", "policy", "_cached_snapshot")
+
+    def __init__(self, ttl: float = 0.01, policy: Optional[MemoryPolicyPort] = None):
+        """
+        Initialize the psutil memory monitor.
+
+        Args:
+            ttl: Seconds a psutil snapshot is reused before being refreshed
+            policy: Memory policy used to fill in safe_available (if None,
+                safe_available equals available)
+        """
+        self.ttl = ttl
+        self.policy = policy
+        self._cached_snapshot: Optional[tuple[float, MemoryInfo]] = None
+
     def get_memory_info(self) -> MemoryInfo:
         """Get current system memory information using psutil."""
+        now = time.monotonic()
+        if self._cached_snapshot is not None:
+            timestamp, memory_info = self._cached_snapshot
+            if now - timestamp < self.ttl:
+                return memory_info
+
         memory = psutil.virtual_memory()
-        return MemoryInfo(
+        memory_info = MemoryInfo(
             total=memory.total,
             available=memory.available,
             used=memory.used,
             percent=memory.percent,
-            safe_available=memory.available,  # Will be overridden by policy
+            safe_available=(
+                self.policy.get_safe_available_memory(memory.available)
+                if self.policy is not None
+                else memory.available
+            ),
         )
+        self._cached_snapshot = (now, memory_info)
+        return memory_info
 
     def get_available_memory(self) -> int:
         """Get available memory in bytes using psutil."""
-        return psutil.virtual_memory().available
+        return self.get_memory_info().available
 
     def get_total_memory(self) -> int:
         """Get total system memory in bytes using psutil."""
-        return psutil.virtual_memory().total
+        return self.get_memory_info().total
 
 
 class SafetyMarginMemoryPolicyAdapter(MemoryPolicyPort):
     """Adapter for safety margin-based memory policy."""
 
+    __slots__ = ("_safety_margin", "_num", "_den")
+
     def __init__(self, safety_margin: float = 0.1):
         """
         Initialize the safety margin memory policy.
@@ -42,70 +78,127 @@ class SafetyMarginMemoryPolicyAdapter(MemoryPolicyPort):
         Args:
             safety_margin: Safety margin as a fraction (0.1 = 10% buffer)
         """
+        self._den = 1_000_000
         self.safety_margin = safety_margin
 
-    def should_execute(self, estimated_usage: int, available_memory: int) -> bool:
+    @property
+    def safety_margin(self) -> float:
+        """Safety margin as a fraction (0.1 = 10% buffer)."""
+        return self._safety_margin
+
+    @safety_margin.setter
+    def safety_margin(self, safety_margin: float) -> None:
+        self._safety_margin = safety_margin
+        # Fixed-point ratio of usable memory, so decisions use integer math only
+        self._num = int(round((1 - safety_margin) * self._den))
+
+    def should_execute(self, check: MemoryCheckResult) -> bool:
         """Determine if operation should execute based on safety margin."""
-        safe_available = self.get_safe_available_memory(available_memory)
-        return estimated_usage <= safe_available
+        return check.estimated_usage * self._den <= check.available * self._num
 
     def get_safe_available_memory(self, total_available: int) -> int:
         """Calculate safe available memory after applying safety margin."""
-        return int(total_available * (1 - self.safety_margin))
+        return (total_available * self._num) // self._den
+
+    def evaluate(
+        self, estimated_usage: int, memory_info: MemoryInfo
+    ) -> tuple[bool, MemoryCheckResult]:
+        """Build the memory check and decide on it with one scaled product."""
+        available = memory_info.available
+        limit = available * self._num
+        check = MemoryCheckResult(
+            estimated_usage, available, limit // self._den, memory_info.total
+        )
+        return estimated_usage * self._den <= limit, check
+
+    def should_execute_batch(
+        self, estimates: Sequence[int], available_memory: int
+    ) -> list[bool]:
+        """Decide for many estimates against a single available memory reading."""
+        limit = available_memory * self._num
+        den = self._den
+        return [estimated_usage * den <= limit for estimated_usage in estimates]
 
 
 class LoggerExecutionDecisionAdapter(ExecutionDecisionPort):
     """Adapter for execution decision logging using the logger."""
 
-    def log_memory_check(
-        self, estimated_usage: int, available_memory: int, safe_available: int
-    ) -> None:
+    __slots__ = ()
+
+    def log_memory_check(self, check: MemoryCheckResult) -> None:
         """Log memory check information."""
-        logger.info(
-            f"Memory check: Available={available_memory // (1024**2)}MB, "
-            f"Estimated={estimated_usage // (1024**2)}MB, "
-            f"Safe available={safe_available // (1024**2)}MB"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Memory check: Available=%dMB, Estimated=%dMB, Safe available=%dMB",
+                int(check.available) >> 20,
+                int(check.estimated_usage) >> 20,
+                int(check.safe_available) >> 20,
+            )
 
     def log_execution_decision(
         self, func_name: str, should_execute: bool, reason: str = ""
     ) -> None:
         """Log execution decision."""
         if should_execute:
-            logger.info(f"Executing function {func_name} with sufficient memory")
+            logger.info("Executing function %s with sufficient memory", func_name)
         else:
-            logger.warning(f"Skipping function {func_name}: {reason}")
+            logger.warning("Skipping function %s: %s", func_name, reason)
 
     def log_memory_error(self, estimated_usage: int, available_memory: int) -> None:
         """Log memory constraint error."""
-        error_msg = (
-            f"Insufficient memory: estimated {estimated_usage // (1024**2)}MB "
-            f"exceeds available memory"
-        )
-        logger.warning(error_msg)
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Insufficient memory: estimated %dMB exceeds available memory",
+                int(estimated_usage) >> 20,
+            )
 
 
 # Memory estimator adapters (keeping existing functionality)
 class FileSizeMemoryEstimatorAdapter(MemoryEstimatorPort):
     """Adapter for file size-based memory estimation."""
 
+    __slots__ = ("multiplier", "_cache")
+
+    max_cached_paths = 1024
+
     def __init__(self, multiplier: float = 2.0):
         self.multiplier = multiplier
+        # Each path is stat'ed only once until clear_cache() is called
+        self._cache: OrderedDict[str, int] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Forget the cached file sizes, so files are stat'ed again."""
+        self._cache.clear()
 
     def estimate_memory_usage(self, file_path: str, *args, **kwargs) -> int:
         """Estimate memory usage based on file size."""
-        import os
-
-        try:
-            file_size = os.path.getsize(file_path)
-            return int(file_size * self.multiplier)
-        except (OSError, FileNotFoundError):
-            return 0
+        return int(self._file_size(file_path) * self.multiplier)
+
+    def estimate_memory_usage_batch(self, args_list: Sequence[tuple]) -> list[int]:
+        """Estimate memory usage based on file size for every task of a batch."""
+        file_size = self._file_size
+        multiplier = self.multiplier
+        return [int(file_size(args[0]) * multiplier) for args in args_list]
+
+    def _file_size(self, file_path: str) -> int:
+        """Get the cached size of a file, 0 if it can't be accessed."""
+        size = self._cache.get(file_path)
+        if size is None:
+            try:
+                size = os.stat(file_path).st_size
+            except OSError:
+                return 0
+            self._cache[file_path] = size
+            if len(self._cache) > self.max_cached_paths:
+                self._cache.popitem(last=False)
+        return size
 
 
 class DataSizeMemoryEstimatorAdapter(MemoryEstimatorPort):
     """Adapter for data size-based memory estimation."""
 
+    __slots__ = ("multiplier",)
+
     def __init__(self, multiplier: float = 1.5):
         self.multiplier = multiplier
 
@@ -113,10 +206,17 @@ class DataSizeMemoryEstimatorAdapter(MemoryEstimatorPort):
         """Estimate memory usage based on data size."""
         return int(data_size * self.multiplier)
 
+    def estimate_memory_usage_batch(self, args_list: Sequence[tuple]) -> list[int]:
+        """Estimate memory usage based on data size for every task of a batch."""
+        multiplier = self.multiplier
+        return [int(args[0] * multiplier) for args in args_list]
+
 
 class FixedMemoryEstimatorAdapter(MemoryEstimatorPort):
     """Adapter for fixed memory estimation (useful for testing)."""
 
+    __slots__ = ("fixed_amount",)
+
     def __init__(self, fixed_amount: int):
         self.fixed_amount = fixed_amount
 
@@ -124,10 +224,16 @@ class FixedMemoryEstimatorAdapter(MemoryEstimatorPort):
         """Return fixed memory estimation."""
         return self.fixed_amount
 
+    def estimate_memory_usage_batch(self, args_list: Sequence[tuple]) -> list[int]:
+        """Return the fixed memory estimation for every task of a batch."""
+        return [self.fixed_amount] * len(args_list)
+
 
 class CustomMemoryEstimatorAdapter(MemoryEstimatorPort):
     """Adapter for custom memory estimation functions."""
 
+    __slots__ = ("estimator_func",)
+
     def __init__(self, estimator_func: callable):
         self.estimator_func = estimator_func
 
@@ -1,5 +1,5 @@
 """Application layer components for execution handling."""
 
-from .execution_handler import ExecutionHandler
+from .execution_handler import ExecutionHandler, shutdown_all
 
-__all__ = ["ExecutionHandler"]
+__all__ = ["ExecutionHandler", "shutdown_all"]
@@ -1,32 +1,241 @@
-from typing import Callable, Any
+import atexit
+import functools
+import pickle
+import sys
+import threading
+import types
+import weakref
+from typing import Callable, Any, Iterable, Iterator, Optional
 from mpire import WorkerPool
 
 
+class _SharedPool:
+    """A reusable worker pool and what its running workers were started with."""
+
+    __slots__ = ("pool", "started", "apply_started", "funcs", "__weakref__")
+
+    def __init__(self, n_workers: int):
+        # keep_alive reuses the (forked) workers across execute/execute_batch calls
+        self.pool = WorkerPool(n_jobs=n_workers, keep_alive=True)
+        # Whether workers are running, and whether apply() started them
+        self.started = False
+        self.apply_started = False
+        # Functions that existed when the workers were last forked
+        self.funcs: weakref.WeakSet = weakref.WeakSet()
+
+
+# Idle pools by worker count. mpire runs one map at a time per pool, so each
+# pool is leased to a single handler and handed to the next one on release
+_IDLE_POOLS: dict[int, list[_SharedPool]] = {}
+# Every live pool, idle or leased, for shutdown_all()
+_ALL_POOLS: set[_SharedPool] = set()
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire_pool(n_workers: int) -> _SharedPool:
+    """Lease an idle pool of n_workers, creating one if none is idle."""
+    with _POOL_LOCK:
+        idle = _IDLE_POOLS.get(n_workers)
+        if idle:
+            return idle.pop()
+        shared = _SharedPool(n_workers)
+        _ALL_POOLS.add(shared)
+        return shared
+
+
+def _release_pool(n_workers: int, shared: _SharedPool) -> None:
+    """Return a leased pool for reuse, unless shutdown_all() terminated it."""
+    with _POOL_LOCK:
+        if shared in _ALL_POOLS:
+            _IDLE_POOLS.setdefault(n_workers, []).append(shared)
+
+
+# Pickling results for callables other than plain functions, held weakly
+_PICKLABLE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _resolves_by_name(func: Callable) -> bool:
+    """Check that func is found under its module and qualified name, as pickle does."""
+    obj = sys.modules.get(func.__module__)
+    for name in func.__qualname__.split("."):
+        obj = getattr(obj, name, None)
+    return obj is func
+
+
+def _is_picklable(func: Callable) -> bool:
+    """Check whether func can be sent to already running workers."""
+    if isinstance(func, types.FunctionType) or (
+        isinstance(func, types.BuiltinFunctionType)
+        and isinstance(func.__self__, types.ModuleType)
+    ):
+        # Functions are pickled by name, lambdas and closures have none
+        return _resolves_by_name(func)
+
+    try:
+        return _PICKLABLE[func]
+    except (KeyError, TypeError):
+        pass
+    try:
+        pickle.dumps(func)
+        picklable = True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        picklable = False
+    try:
+        _PICKLABLE[func] = picklable
+    except TypeError:
+        # Not weakly referenceable or hashable, checked again next time
+        pass
+    return picklable
+
+
+@atexit.register
+def shutdown_all() -> None:
+    """
+    Terminate every shared worker pool.
+
+    Runs at interpreter shutdown; call it earlier to release the workers.
+    Handlers lease new pools afterwards.
+    """
+    with _POOL_LOCK:
+        for shared in _ALL_POOLS:
+            shared.pool.terminate()
+        _ALL_POOLS.clear()
+        _IDLE_POOLS.clear()
+
+
 class ExecutionHandler:
-    """Base execution handler for running functions in worker processes."""
+    """
+    Base execution handler for running functions in worker processes.
+
+    Each handler leases a worker pool on first use and hands it back on
+    close(), so later handlers with the same n_workers reuse its workers.
+
+    With n_workers=0 no worker pool is created and functions run inline on
+    the calling thread, which is handy for tests and cheap tasks.
+    """
 
     def __init__(self, n_workers: int = 4):
         self.n_workers = n_workers
-        self.worker_pool = WorkerPool(n_jobs=n_workers)
+        self._inline = n_workers == 0
+        self._shared: Optional[_SharedPool] = None
+        self._release: Optional[weakref.finalize] = None
+
+    @property
+    def worker_pool(self) -> Optional[WorkerPool]:
+        """Worker pool leased by this handler (None when running inline)."""
+        return None if self._inline else self._lease().pool
+
+    def _lease(self) -> _SharedPool:
+        """Get the pool leased by this handler, leasing one on first use."""
+        shared = self._shared
+        # Lease again after shutdown_all() terminated the pool
+        if shared is None or shared not in _ALL_POOLS:
+            if self._release is not None:
+                self._release.detach()
+            shared = self._shared = _acquire_pool(self.n_workers)
+            # Hand the pool back on close() or once the handler is collected
+            self._release = weakref.finalize(
+                self, _release_pool, self.n_workers, shared
+            )
+        return shared
 
     def execute(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function in worker process and return result"""
-        results = self.worker_pool.map(
-            func,
-            [args],  # mpire expects iterable of argument tuples
-            iterable_len=1,
-        )
-        return list(results)[0]
+        if self._inline:
+            return func(*args, **kwargs)
+        shared = self._lease()
+        if self._needs_fresh_workers(shared, func):
+            # apply() always sends func by pickle, so run it as a one-task
+            # ordered map on workers forked with it instead
+            self._prepare_ordered_map(shared, func)
+            task = functools.partial(func, *args, **kwargs)
+            return next(shared.pool.imap(task, [()], chunk_size=1))
+        if not shared.started:
+            shared.started = shared.apply_started = True
+        self._remember(shared, func)
+        return shared.pool.apply(func, args=args, kwargs=kwargs)
 
-    def execute_batch(self, func: Callable, args_list: list) -> list:
+    def execute_batch(self, func: Callable, args_list: Iterable) -> list:
         """Execute multiple functions in worker processes"""
-        return list(self.worker_pool.map(func, args_list))
+        # Iterables without a length (e.g. generators) leave chunking to mpire
+        chunk_size = (
+            self._chunk_size(len(args_list)) if hasattr(args_list, "__len__") else None
+        )
+        return list(self.iter_batch(func, args_list, chunk_size=chunk_size))
+
+    def iter_batch(
+        self, func: Callable, args_list: Iterable, chunk_size: Optional[int] = None
+    ) -> Iterator[Any]:
+        """Execute multiple functions in worker processes, yielding results in order"""
+        if self._inline:
+            # Unpack arguments the same way mpire does
+            for args in args_list:
+                if isinstance(args, tuple):
+                    yield func(*args)
+                elif isinstance(args, dict):
+                    yield func(**args)
+                else:
+                    yield func(args)
+            return
+
+        shared = self._lease()
+        self._prepare_ordered_map(shared, func)
+        yield from shared.pool.imap(func, args_list, chunk_size=chunk_size)
+
+    def _chunk_size(self, n_tasks: int) -> int:
+        """Split a batch into roughly four chunks per worker."""
+        return max(1, n_tasks // (max(self.n_workers, 1) * 4))
+
+    def _prepare_ordered_map(self, shared: _SharedPool, func: Callable) -> None:
+        """
+        Restart the leased workers when they can't run an ordered map() of func.
+
+        mpire workers decide whether to tag results with their task index when
+        they start and only revisit that on new map parameters, so workers
+        spawned by apply() would hand untagged results to map(). Running
+        workers also only receive a new func by pickle, see
+        _needs_fresh_workers.
+        """
+        if shared.apply_started or (
+            shared.started and self._needs_fresh_workers(shared, func)
+        ):
+            shared.pool.stop_and_join(keep_alive=False)
+            shared.apply_started = False
+        shared.started = True
+        self._remember(shared, func)
+
+    @staticmethod
+    def _needs_fresh_workers(shared: _SharedPool, func: Callable) -> bool:
+        """
+        Check whether func can't be sent to the running leased workers.
+
+        Lambdas and closures can't be pickled at all. Other functions are
+        pickled by reference, which fails inside workers forked before the
+        function was defined (e.g. in a REPL), so functions new to the pool
+        get freshly forked workers as well.
+        """
+        if not _is_picklable(func):
+            return True
+        return shared.started and func not in shared.funcs
+
+    @staticmethod
+    def _remember(shared: _SharedPool, func: Callable) -> None:
+        """Record that the leased workers, once (re)started, know func."""
+        try:
+            shared.funcs.add(func)
+        except TypeError:
+            # Callables that can't be weakly referenced always count as new
+            pass
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.worker_pool.terminate()
+        self.close()
 
     def close(self):
-        self.worker_pool.terminate()
+        """Hand the leased worker pool back for reuse; it stays up until exit."""
+        if self._release is not None:
+            self._release()
+            self._release = None
+        self._shared = None
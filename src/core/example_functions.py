@@ -1,43 +1,94 @@
+import mmap
 import os
+import stat
 import time
-from typing import List, Any
+from typing import List, Any, Optional
 from ..infrastructure.logger import logger
 
+# Pattern repeated by create_large_string and create_large_bytes
+_PATTERN = b"Hello, World! "
 
-def read_file_to_string(file_path: str) -> str:
+
+def _universal_newlines(content: str) -> str:
+    """Match the newline translation of text mode on binary-read content."""
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_mapped(file_path: str) -> str:
+    """Decode a file straight from a read-only memory map of it."""
+    with open(file_path, "rb") as file:
+        file_stat = os.fstat(file.fileno())
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            # Empty files, pipes and procfs files (sized 0) can't be mapped
+            content = str(file.read(), "utf-8")
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8")
+    return _universal_newlines(content)
+
+
+def read_file_to_string(
+    file_path: str, _estimated_size: Optional[int] = None, use_mmap: bool = True
+) -> str:
     """
     Read a file and return its contents as a string.
 
     Args:
         file_path: Path to the file to read
+        _estimated_size: Optional size hint in bytes (e.g. the memory estimate
+            passed by MemoryConstrainedExecutionHandler) used to preallocate
+            the read buffer instead of letting it grow. Only used with
+            use_mmap=False, the mapped read has no buffer to preallocate
+        use_mmap: Decode from a memory map of the file, skipping the
+            intermediate read buffer (the mapped pages and the decoded string
+            still both take memory while reading)
 
     Returns:
         File contents as a string
     """
-    logger.info(f"Reading file: {file_path}")
-    with open(file_path, "r", encoding="utf-8") as file:
-        content = file.read()
-    logger.info(f"Successfully read {len(content)} characters from {file_path}")
+    logger.info("Reading file: %s", file_path)
+    if use_mmap:
+        content = _read_mapped(file_path)
+    elif _estimated_size:
+        with open(file_path, "rb") as file:
+            buffer = bytearray(_estimated_size)
+            n_read = file.readinto(buffer)
+            if n_read == len(buffer):
+                # The hint was too small, read whatever is left
+                buffer += file.read()
+                n_read = len(buffer)
+        content = _universal_newlines(str(memoryview(buffer)[:n_read], "utf-8"))
+    else:
+        with open(file_path, "r", encoding="utf-8") as file:
+            content = file.read()
+    logger.info("Successfully read %d characters from %s", len(content), file_path)
     return content
 
 
-def process_large_list(item_count: int) -> List[int]:
+def _fill_doubled(n: int) -> List[int]:
+    """Build [0, 2, 4, ...] of length n; the stepped range is filled in C."""
+    return list(range(0, 2 * n, 2))
+
+
+def process_large_list(item_count: int, simulate_delay: bool = False) -> List[int]:
     """
     Process a large list of numbers (simulates memory-intensive operation).
 
     Args:
         item_count: Number of items to process
+        simulate_delay: Sleep for 0.1s first to simulate slow processing
 
     Returns:
         List of processed items
     """
-    logger.info(f"Processing list with {item_count} items")
-    # Simulate some processing time
-    time.sleep(0.1)
+    logger.debug("Processing list with %d items", item_count)
+    if simulate_delay:
+        time.sleep(0.1)
 
-    # Create a large list
-    result = [i * 2 for i in range(item_count)]
-    logger.info(f"Successfully processed {len(result)} items")
+    result = _fill_doubled(item_count)
+    logger.debug("Successfully processed %d items", len(result))
     return result
 
 
@@ -51,18 +102,35 @@ def create_large_string(size_mb: int) -> str:
     Returns:
         Large string
     """
-    logger.info(f"Creating string of {size_mb}MB")
-    size_bytes = size_mb * 1024 * 1024
-    # Create a string by repeating a pattern
-    pattern = "Hello, World! "
-    pattern_size = len(pattern.encode("utf-8"))
-    repetitions = size_bytes // pattern_size
+    logger.info("Creating string of %dMB", size_mb)
+    # The pattern is ASCII, so repeat it as bytes and decode once
+    result = _repeat_pattern(size_mb).decode("ascii")
+    logger.info("Successfully created string of %d characters", len(result))
+    return result
+
 
-    result = pattern * repetitions
-    logger.info(f"Successfully created string of {len(result)} characters")
+def create_large_bytes(size_mb: int) -> bytes:
+    """
+    Create a large bytes object of specified size.
+
+    Args:
+        size_mb: Size of the data in megabytes
+
+    Returns:
+        Large bytes object, the same content as create_large_string
+    """
+    logger.info("Creating bytes of %dMB", size_mb)
+    result = _repeat_pattern(size_mb)
+    logger.info("Successfully created %d bytes", len(result))
     return result
 
 
+def _repeat_pattern(size_mb: int) -> bytes:
+    """Repeat the sample pattern as many whole times as fit in size_mb."""
+    size_bytes = size_mb * 1024 * 1024
+    return _PATTERN * (size_bytes // len(_PATTERN))
+
+
 def memory_intensive_operation(data_size_mb: int) -> List[bytes]:
     """
     Perform a memory-intensive operation.
@@ -73,21 +141,38 @@ def memory_intensive_operation(data_size_mb: int) -> List[bytes]:
     Returns:
         List of processed data chunks
     """
-    logger.info(f"Performing memory-intensive operation with {data_size_mb}MB of data")
+    logger.info("Performing memory-intensive operation with %dMB of data", data_size_mb)
 
-    # Create data chunks
+    # Create data chunks; the size is whole megabytes, so every chunk is full
+    # and, bytes being immutable, they can all share one object
     chunk_size = 1024 * 1024  # 1MB chunks
-    total_size = data_size_mb * 1024 * 1024
-    chunks = []
-
-    for i in range(0, total_size, chunk_size):
-        chunk = b"x" * min(chunk_size, total_size - i)
-        chunks.append(chunk)
+    chunks = [b"x" * chunk_size] * data_size_mb if data_size_mb > 0 else []
 
-    logger.info(f"Successfully created {len(chunks)} data chunks")
+    logger.info("Successfully created %d data chunks", len(chunks))
     return chunks
 
 
+def _write_test_content(file_path: str) -> str:
+    """Write the test content to a file."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write("Test content")
+    return "File written successfully"
+
+
+def _delete_file(file_path: str) -> str:
+    """Delete a file."""
+    os.remove(file_path)
+    return "File deleted successfully"
+
+
+# Operations supported by safe_file_operation
+_FILE_OPERATIONS = {
+    "read": _read_mapped,
+    "write": _write_test_content,
+    "delete": _delete_file,
+}
+
+
 def safe_file_operation(file_path: str, operation: str = "read") -> Any:
     """
     Perform a safe file operation with error handling.
@@ -99,21 +184,13 @@ def safe_file_operation(file_path: str, operation: str = "read") -> Any:
     Returns:
         Result of the operation
     """
-    logger.info(f"Performing {operation} operation on {file_path}")
+    logger.info("Performing %s operation on %s", operation, file_path)
 
     try:
-        if operation == "read":
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
-        elif operation == "write":
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write("Test content")
-                return "File written successfully"
-        elif operation == "delete":
-            os.remove(file_path)
-            return "File deleted successfully"
-        else:
+        file_operation = _FILE_OPERATIONS.get(operation)
+        if file_operation is None:
             raise ValueError(f"Unknown operation: {operation}")
+        return file_operation(file_path)
     except Exception as e:
-        logger.error(f"Error during {operation} operation: {e}")
+        logger.error("Error during %s operation: %s", operation, e)
         raise
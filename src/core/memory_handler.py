@@ -1,3 +1,6 @@
+import functools
+import inspect
+import types
 from typing import Callable, Any, Optional
 from ..application.execution_handler import ExecutionHandler
 from ..ports import (
@@ -5,9 +8,73 @@ from ..ports import (
     MemoryEstimatorPort,
     MemoryPolicyPort,
     ExecutionDecisionPort,
+    MemoryCheckResult,
+    MemoryInfo,
 )
 
 
+def _accepts_estimated_size(func: Callable) -> bool:
+    """Check whether func takes the admission estimate as an `_estimated_size` hint."""
+    code = getattr(getattr(func, "__func__", func), "__code__", None)
+    if code is not None and not hasattr(func, "__wrapped__"):
+        # Cached per code object, which doesn't keep func or its closure alive
+        return _code_accepts_estimated_size(code)
+    try:
+        return "_estimated_size" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _code_accepts_estimated_size(code: types.CodeType) -> bool:
+    """Check whether a function's code takes an `_estimated_size` argument."""
+    n_args = code.co_argcount + code.co_kwonlyargcount
+    return "_estimated_size" in code.co_varnames[:n_args]
+
+
+@functools.lru_cache(maxsize=256)
+def _has_matching_batch_estimate(cls: type) -> bool:
+    """
+    Check whether cls's batch estimate agrees with its single-task estimate.
+
+    A subclass overriding only estimate_memory_usage would otherwise have
+    batches estimated by its parent's estimate_memory_usage_batch.
+    """
+
+    def defining_class(name: str) -> Optional[type]:
+        return next((klass for klass in cls.__mro__ if name in vars(klass)), None)
+
+    batch_owner = defining_class("estimate_memory_usage_batch")
+    single_owner = defining_class("estimate_memory_usage")
+    return (
+        batch_owner is not None
+        and single_owner is not None
+        and issubclass(batch_owner, single_owner)
+    )
+
+
+# Default adapter classes, imported on first use so that handlers given all
+# their ports don't load psutil
+_DEFAULTS: dict[str, type] = {}
+
+
+def _default_adapters() -> dict[str, type]:
+    """Get the default adapter classes, importing them once."""
+    if not _DEFAULTS:
+        from ..adapters import (
+            LoggerExecutionDecisionAdapter,
+            PsutilMemoryMonitorAdapter,
+            SafetyMarginMemoryPolicyAdapter,
+        )
+
+        _DEFAULTS.update(
+            policy=SafetyMarginMemoryPolicyAdapter,
+            monitor=PsutilMemoryMonitorAdapter,
+            execution_decision=LoggerExecutionDecisionAdapter,
+        )
+    return _DEFAULTS
+
+
 class MemoryConstrainedExecutionHandler(ExecutionHandler):
     """
     Execution handler that checks available memory before executing functions.
@@ -16,6 +83,9 @@ class MemoryConstrainedExecutionHandler(ExecutionHandler):
     if there's sufficient available memory on the system.
     """
 
+    short_circuit_factor = 8
+    fast_admission_threshold = 1000
+
     def __init__(
         self,
         n_workers: int = 4,
@@ -34,49 +104,96 @@ class MemoryConstrainedExecutionHandler(ExecutionHandler):
         """
         super().__init__(n_workers)
 
-        # Use dependency injection with defaults
-        if memory_monitor is None:
-            from ..adapters import PsutilMemoryMonitorAdapter
+        # Use dependency injection with defaults, built per handler
+        ports = (memory_monitor, memory_policy, execution_decision)
+        defaults = _default_adapters() if any(p is None for p in ports) else {}
+        self.memory_policy = (
+            defaults["policy"]() if memory_policy is None else memory_policy
+        )
+        # The default monitor applies the policy itself, so its snapshots
+        # already carry the final safe_available
+        self._monitor_applies_policy = memory_monitor is None
+        self.memory_monitor = (
+            defaults["monitor"](policy=self.memory_policy)
+            if memory_monitor is None
+            else memory_monitor
+        )
+        self.execution_decision = (
+            defaults["execution_decision"]()
+            if execution_decision is None
+            else execution_decision
+        )
+
+    def _check_memory_availability(
+        self,
+        estimated_usage: int,
+        memory_info: Optional[MemoryInfo] = None,
+        decisions: Optional[dict] = None,
+    ) -> tuple[bool, MemoryCheckResult]:
+        """
+        Check if there's enough memory available for the estimated usage.
 
-            self.memory_monitor = PsutilMemoryMonitorAdapter()
-        else:
-            self.memory_monitor = memory_monitor
+        Args:
+            estimated_usage: Estimated memory usage in bytes
+            memory_info: Memory snapshot to check against (fetched if None)
+            decisions: Decisions already made against memory_info, keyed by
+                estimate; reused and filled in when given
 
-        if memory_policy is None:
-            from ..adapters import SafetyMarginMemoryPolicyAdapter
+        Returns:
+            Tuple of the policy decision and the memory check it was based on
+        """
+        if memory_info is None:
+            memory_info = self.memory_monitor.get_memory_info()
 
-            self.memory_policy = SafetyMarginMemoryPolicyAdapter()
-        else:
-            self.memory_policy = memory_policy
+        # Use policy to build the check and make the decision in one call
+        decision = decisions.get(estimated_usage) if decisions is not None else None
+        if decision is None:
+            decision = self._evaluate(estimated_usage, memory_info)
+            if decisions is not None:
+                decisions[estimated_usage] = decision
+        should_execute, check = decision
 
-        if execution_decision is None:
-            from ..adapters import LoggerExecutionDecisionAdapter
+        # Log memory check
+        self.execution_decision.log_memory_check(check)
+        return should_execute, check
 
-            self.execution_decision = LoggerExecutionDecisionAdapter()
-        else:
-            self.execution_decision = execution_decision
+    def _evaluate(
+        self, estimated_usage: int, memory_info: MemoryInfo
+    ) -> tuple[bool, MemoryCheckResult]:
+        """Build the memory check and decide on it, fused if the policy allows."""
+        if isinstance(self.memory_policy, MemoryPolicyPort):
+            return self.memory_policy.evaluate(estimated_usage, memory_info)
+        # Duck-typed policies only provide the two separate steps
+        check = MemoryCheckResult(
+            estimated_usage=estimated_usage,
+            available=memory_info.available,
+            safe_available=self._safe_available(memory_info),
+            total=memory_info.total,
+        )
+        return self.memory_policy.should_execute(check), check
 
-    def _check_memory_availability(self, estimated_usage: int) -> bool:
+    def _has_ample_memory(self, estimated_usage: int, memory_info: MemoryInfo) -> bool:
         """
-        Check if there's enough memory available for the estimated usage.
+        Check whether a task is small enough to admit without the full check.
+
+        Only the plain safety margin policy decides on safe_available alone,
+        so only its decisions are known in advance for small tasks.
 
         Args:
             estimated_usage: Estimated memory usage in bytes
+            memory_info: Memory snapshot to check against
 
         Returns:
-            True if there's enough memory, False otherwise
+            True if the policy is a plain safety margin and the snapshot's safe
+            available memory covers short_circuit_factor times the estimate
         """
-        available_memory = self.memory_monitor.get_available_memory()
-        safe_available = self.memory_policy.get_safe_available_memory(available_memory)
-
-        # Log memory check
-        self.execution_decision.log_memory_check(
-            estimated_usage, available_memory, safe_available
+        # The memoized default class, as this runs on every checked execution
+        if type(self.memory_policy) is not _default_adapters()["policy"]:
+            return False
+        return estimated_usage * self.short_circuit_factor <= self._safe_available(
+            memory_info
         )
 
-        # Use policy to make decision
-        return self.memory_policy.should_execute(estimated_usage, available_memory)
-
     def execute_with_memory_check(
         self,
         func: Callable,
@@ -102,16 +219,23 @@ class MemoryConstrainedExecutionHandler(ExecutionHandler):
         if memory_estimator is not None:
             estimated_usage = memory_estimator.estimate_memory_usage(*args, **kwargs)
 
-            if not self._check_memory_availability(estimated_usage):
-                available_memory = self.memory_monitor.get_available_memory()
+            # Hand the estimate to functions that can size their buffers from it
+            if "_estimated_size" not in kwargs and _accepts_estimated_size(func):
+                kwargs["_estimated_size"] = estimated_usage
+
+            # Small tasks against plenty of headroom always pass
+            memory_info = self.memory_monitor.get_memory_info()
+            if self._has_ample_memory(estimated_usage, memory_info):
+                return func(*args, **kwargs)
+
+            should_execute, check = self._check_memory_availability(
+                estimated_usage, memory_info
+            )
+            if not should_execute:
                 self.execution_decision.log_memory_error(
-                    estimated_usage, available_memory
+                    estimated_usage, check.available
                 )
-                error_msg = (
-                    f"Insufficient memory: estimated {estimated_usage // (1024**2)}MB "
-                    f"exceeds available memory"
-                )
-                raise MemoryError(error_msg)
+                raise MemoryError(self._insufficient_memory_message(estimated_usage))
 
         # Log execution decision
         self.execution_decision.log_execution_decision(func.__name__, True)
@@ -134,29 +258,36 @@ class MemoryConstrainedExecutionHandler(ExecutionHandler):
             memory_estimator: Optional memory estimator for the function
 
         Returns:
-            List of results for successfully executed functions
+            List of results in input order, None for tasks skipped due to
+            memory constraints
         """
-        results = []
-        skipped_count = 0
-
-        for args in args_list:
-            try:
-                if isinstance(args, tuple):
-                    result = self.execute_with_memory_check(
-                        func, memory_estimator, *args
-                    )
-                else:
-                    result = self.execute_with_memory_check(
-                        func, memory_estimator, args
-                    )
-                results.append(result)
-            except MemoryError as e:
-                self.execution_decision.log_execution_decision(
-                    func.__name__, False, str(e)
-                )
-                skipped_count += 1
-                results.append(None)
+        # Admit the whole batch up front against a single memory snapshot
+        memory_info = (
+            self.memory_monitor.get_memory_info()
+            if memory_estimator is not None
+            else None
+        )
+        admission = self._fast_batch_admission(
+            func, args_list, memory_estimator, memory_info
+        )
+        if admission is None:
+            admission = self._admit_batch(
+                func, args_list, memory_estimator, memory_info
+            )
+        admitted_indices, admitted_args = admission
+
+        # Run every admitted task in one submission to the worker pool
+        results = [None] * len(args_list)
+        if admitted_args:
+            raw_results = self.iter_batch(
+                func,
+                admitted_args,
+                chunk_size=self._chunk_size(len(admitted_args)),
+            )
+            for index, result in zip(admitted_indices, raw_results):
+                results[index] = result
 
+        skipped_count = len(args_list) - len(admitted_args)
         if skipped_count > 0:
             self.execution_decision.log_execution_decision(
                 f"batch_{func.__name__}",
@@ -166,17 +297,164 @@ class MemoryConstrainedExecutionHandler(ExecutionHandler):
 
         return results
 
+    def _admit_batch(
+        self,
+        func: Callable,
+        args_list: list,
+        memory_estimator: Optional[MemoryEstimatorPort],
+        memory_info: Optional[MemoryInfo],
+    ) -> tuple[list, list]:
+        """
+        Run the memory check for every task in a batch.
+
+        Args:
+            func: Function to execute
+            args_list: List of argument tuples for batch execution
+            memory_estimator: Optional memory estimator for the function
+            memory_info: Memory snapshot to check against
+
+        Returns:
+            Admitted indices and argument tuples
+        """
+        admitted_indices, admitted_args = [], []
+        args_tuples = [
+            args if isinstance(args, tuple) else (args,) for args in args_list
+        ]
+        if memory_estimator is not None:
+            estimates = self._estimate_batch(memory_estimator, args_tuples)
+            # Tasks with equal estimates share one policy decision in this batch
+            decisions: dict[int, tuple[bool, MemoryCheckResult]] = {}
+
+        for index, args in enumerate(args_tuples):
+            if memory_estimator is not None:
+                estimated_usage = estimates[index]
+                should_execute, check = self._check_memory_availability(
+                    estimated_usage, memory_info, decisions
+                )
+                if not should_execute:
+                    self.execution_decision.log_memory_error(
+                        estimated_usage, check.available
+                    )
+                    self.execution_decision.log_execution_decision(
+                        func.__name__,
+                        False,
+                        self._insufficient_memory_message(estimated_usage),
+                    )
+                    continue
+
+            self.execution_decision.log_execution_decision(func.__name__, True)
+            admitted_indices.append(index)
+            admitted_args.append(args)
+
+        return admitted_indices, admitted_args
+
+    def _fast_batch_admission(
+        self,
+        func: Callable,
+        args_list: list,
+        memory_estimator: Optional[MemoryEstimatorPort],
+        memory_info: Optional[MemoryInfo],
+    ) -> Optional[tuple[list, list]]:
+        """
+        Admit a large batch with plain arithmetic when estimator and policy allow.
+
+        With fixed, data-size or file-size estimators and the safety margin
+        policy, the batch is estimated in one call and each admission reduces
+        to one compare, so batches of at least fast_admission_threshold tasks
+        skip the per-task policy calls. Refused tasks are logged like in
+        _admit_batch, the memory check is logged once for the largest task.
+
+        Args:
+            func: Function to execute
+            args_list: List of argument tuples for batch execution
+            memory_estimator: Memory estimator for the function
+            memory_info: Memory snapshot to check against
+
+        Returns:
+            Admitted indices and argument tuples, or None if the fast path
+            doesn't apply
+        """
+        from ..adapters import (
+            DataSizeMemoryEstimatorAdapter,
+            FileSizeMemoryEstimatorAdapter,
+            FixedMemoryEstimatorAdapter,
+            SafetyMarginMemoryPolicyAdapter,
+        )
+
+        if (
+            len(args_list) < self.fast_admission_threshold
+            or memory_info is None
+            # Exact types only, subclasses may override the estimate or decision
+            or type(self.memory_policy) is not SafetyMarginMemoryPolicyAdapter
+            or type(memory_estimator)
+            not in (
+                DataSizeMemoryEstimatorAdapter,
+                FileSizeMemoryEstimatorAdapter,
+                FixedMemoryEstimatorAdapter,
+            )
+        ):
+            return None
+
+        args_tuples = [
+            args if isinstance(args, tuple) else (args,) for args in args_list
+        ]
+        estimates = memory_estimator.estimate_memory_usage_batch(args_tuples)
+        admitted = self.memory_policy.should_execute_batch(
+            estimates, memory_info.available
+        )
+        # One check for the largest task stands for the whole batch
+        self.execution_decision.log_memory_check(
+            self.memory_policy.evaluate(max(estimates), memory_info)[1]
+        )
+        admitted_indices = []
+        for index, ok in enumerate(admitted):
+            if ok:
+                admitted_indices.append(index)
+                continue
+            estimated_usage = estimates[index]
+            self.execution_decision.log_memory_error(
+                estimated_usage, memory_info.available
+            )
+            self.execution_decision.log_execution_decision(
+                func.__name__,
+                False,
+                self._insufficient_memory_message(estimated_usage),
+            )
+        return admitted_indices, [args_tuples[index] for index in admitted_indices]
+
+    @staticmethod
+    def _estimate_batch(
+        memory_estimator: MemoryEstimatorPort, args_tuples: list
+    ) -> list[int]:
+        """Estimate a whole batch, in one call if the estimator supports it."""
+        if not _has_matching_batch_estimate(type(memory_estimator)):
+            return [
+                memory_estimator.estimate_memory_usage(*args) for args in args_tuples
+            ]
+        return memory_estimator.estimate_memory_usage_batch(args_tuples)
+
+    @staticmethod
+    def _insufficient_memory_message(estimated_usage: int) -> str:
+        """Build the error message for a task refused for lack of memory."""
+        return (
+            f"Insufficient memory: estimated {int(estimated_usage) >> 20}MB "
+            f"exceeds available memory"
+        )
+
+    def _safe_available(self, memory_info: MemoryInfo) -> int:
+        """Get the policy-adjusted available memory for a snapshot."""
+        if self._monitor_applies_policy:
+            return memory_info.safe_available
+        return self.memory_policy.get_safe_available_memory(memory_info.available)
+
     def get_memory_info(self) -> dict:
         """Get current memory information."""
         memory_info = self.memory_monitor.get_memory_info()
-        safe_available = self.memory_policy.get_safe_available_memory(
-            memory_info.available
-        )
 
         return {
             "total": memory_info.total,
             "available": memory_info.available,
             "used": memory_info.used,
             "percent": memory_info.percent,
-            "safe_available": safe_available,
+            "safe_available": self._safe_available(memory_info),
         }
@@ -11,11 +11,14 @@ class SingletonMeta(type):
     _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
+        # Cached instances are returned as is, __init__ only runs on creation
+        instance = cls._instances.get(cls)
+        if instance is None:
             with cls._lock:
-                if cls not in cls._instances:
-                    cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+        return instance
 
 
 class Singleton(Generic[T]):
@@ -1,11 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Protocol
-from dataclasses import dataclass
+from typing import NamedTuple, Protocol, Sequence
 
 
-@dataclass
-class MemoryInfo:
-    """Data class representing system memory information."""
+class MemoryInfo(NamedTuple):
+    """Immutable record representing system memory information."""
 
     total: int
     available: int
@@ -14,9 +12,20 @@ class MemoryInfo:
     safe_available: int
 
 
+class MemoryCheckResult(NamedTuple):
+    """Immutable record of one admission check, shared by policy and logging."""
+
+    estimated_usage: int
+    available: int
+    safe_available: int
+    total: int
+
+
 class MemoryMonitorPort(ABC):
     """Port interface for monitoring system memory."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_memory_info(self) -> MemoryInfo:
         """Get current system memory information."""
@@ -36,6 +45,8 @@ class MemoryMonitorPort(ABC):
 class MemoryEstimatorPort(Protocol):
     """Port interface for estimating memory usage of operations."""
 
+    __slots__ = ()
+
     def estimate_memory_usage(self, *args, **kwargs) -> int:
         """
         Estimate memory usage in bytes for the given arguments.
@@ -49,18 +60,34 @@ class MemoryEstimatorPort(Protocol):
         """
         pass
 
+    def estimate_memory_usage_batch(self, args_list: Sequence[tuple]) -> list[int]:
+        """
+        Estimate memory usage in bytes for every argument tuple of a batch.
+
+        Optional: the default estimates each task separately, estimators that
+        can compute the whole batch in one pass should override it.
+
+        Args:
+            args_list: Positional argument tuples, one per task
+
+        Returns:
+            Estimated memory usage in bytes, one per task
+        """
+        return [self.estimate_memory_usage(*args) for args in args_list]
+
 
 class MemoryPolicyPort(ABC):
     """Port interface for memory usage policies and decisions."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def should_execute(self, estimated_usage: int, available_memory: int) -> bool:
+    def should_execute(self, check: MemoryCheckResult) -> bool:
         """
         Determine if an operation should be executed based on memory constraints.
 
         Args:
-            estimated_usage: Estimated memory usage in bytes
-            available_memory: Available memory in bytes
+            check: Memory check holding the estimated, available and safe bytes
 
         Returns:
             True if operation should execute, False otherwise
@@ -80,14 +107,38 @@ class MemoryPolicyPort(ABC):
         """
         pass
 
+    def evaluate(
+        self, estimated_usage: int, memory_info: MemoryInfo
+    ) -> tuple[bool, MemoryCheckResult]:
+        """
+        Build the memory check for an estimate and decide on it in one call.
+
+        The default combines get_safe_available_memory and should_execute,
+        policies may override it with a fused computation.
+
+        Args:
+            estimated_usage: Estimated memory usage in bytes
+            memory_info: Memory snapshot to check against
+
+        Returns:
+            Tuple of the decision and the memory check it was based on
+        """
+        check = MemoryCheckResult(
+            estimated_usage=estimated_usage,
+            available=memory_info.available,
+            safe_available=self.get_safe_available_memory(memory_info.available),
+            total=memory_info.total,
+        )
+        return self.should_execute(check), check
+
 
 class ExecutionDecisionPort(ABC):
     """Port interface for execution decisions and logging."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def log_memory_check(
-        self, estimated_usage: int, available_memory: int, safe_available: int
-    ) -> None:
+    def log_memory_check(self, check: MemoryCheckResult) -> None:
         """Log memory check information."""
         pass
 
@@ -0,0 +1,144 @@
+"""Tests for the worker-pool backed ExecutionHandler."""
+
+import functools
+import gc
+import weakref
+
+import pytest
+from src.application.execution_handler import (
+    ExecutionHandler,
+    _is_picklable,
+    shutdown_all,
+)
+
+
+def _scale(x, factor=2):
+    return x * factor
+
+
+class TestExecutionHandler:
+    """Test suite for ExecutionHandler dispatch to the worker pool."""
+
+    def test_execute_forwards_args_and_kwargs(self):
+        """Test that single execution passes positional and keyword arguments."""
+        with ExecutionHandler(n_workers=1) as handler:
+            assert handler.execute(_scale, 3) == 6
+            assert handler.execute(_scale, 3, factor=5) == 15
+
+    def test_execute_runs_unpicklable_functions(self):
+        """Test that lambdas run in workers, on a fresh or an already used pool."""
+        shutdown_all()
+        with ExecutionHandler(n_workers=2) as handler:
+            assert handler.execute(lambda x: x + 1, 1) == 2
+            assert handler.execute(_scale, 2) == 4
+            assert handler.execute(lambda x, y=0: x + y, 1, y=2) == 3
+            assert handler.execute(_scale, 3) == 6
+
+    def test_functions_defined_after_fork_reach_workers(self):
+        """Test that functions defined after the workers started still run."""
+        with ExecutionHandler(n_workers=2) as handler:
+            assert handler.execute_batch(_scale, [(1,), (2,)]) == [2, 4]
+            exec("def _late_batch(x):\n    return x + 10", globals())
+            exec("def _late_single(x):\n    return x + 20", globals())
+            late_batch, late_single = (
+                globals()["_late_batch"],
+                globals()["_late_single"],
+            )
+
+            assert handler.execute_batch(late_batch, [(1,), (2,)]) == [11, 12]
+            assert handler.execute(late_single, 1) == 21
+            assert handler.execute_batch(_scale, [(3,)]) == [6]
+
+    def test_picklability_check_keeps_no_references(self):
+        """Test that checked callables are not kept alive by the check."""
+        closure = lambda x: x + 1  # noqa: E731
+        partial = functools.partial(_scale, factor=3)
+        refs = [weakref.ref(closure), weakref.ref(partial)]
+
+        assert (_is_picklable(closure), _is_picklable(partial)) == (False, True)
+        assert (_is_picklable(_scale), _is_picklable(len)) == (True, True)
+        del closure, partial
+        gc.collect()
+        assert [ref() for ref in refs] == [None, None]
+
+    def test_batch_after_execute_keeps_order(self):
+        """Test that a batch after single executions returns ordered results."""
+        with ExecutionHandler(n_workers=2) as handler:
+            assert handler.execute(_scale, 1) == 2
+            assert handler.execute_batch(_scale, [(i,) for i in range(8)]) == [
+                i * 2 for i in range(8)
+            ]
+            assert handler.execute(_scale, 4) == 8
+
+    def test_execute_batch_accepts_generators(self):
+        """Test that batches can be fed from iterables without a length."""
+        with ExecutionHandler(n_workers=2) as handler:
+            assert handler.execute_batch(_scale, ((i,) for i in range(4))) == [
+                0,
+                2,
+                4,
+                6,
+            ]
+
+    def test_iter_batch_streams_ordered_results(self):
+        """Test that iter_batch yields results lazily and in input order."""
+        with ExecutionHandler(n_workers=2) as handler:
+            results = handler.iter_batch(_scale, [(i,) for i in range(8)])
+
+            assert next(results) == 0
+            assert list(results) == [i * 2 for i in range(1, 8)]
+
+    def test_handlers_share_pool_per_worker_count(self):
+        """Test that handlers reuse a released pool and leave it running on exit."""
+        with ExecutionHandler(n_workers=1) as first:
+            assert first.execute(_scale, 2) == 4
+            first_pool = first.worker_pool
+        second = ExecutionHandler(n_workers=1)
+
+        assert second.worker_pool is first_pool
+        assert ExecutionHandler(n_workers=2).worker_pool is not first_pool
+        assert second.execute_batch(lambda x: x + 1, [1, 2]) == [2, 3]
+
+    def test_interleaved_handlers_use_separate_pools(self):
+        """Test that a handler can run while another one's batch is in flight."""
+        with (
+            ExecutionHandler(n_workers=2) as first,
+            ExecutionHandler(n_workers=2) as second,
+        ):
+            results = first.iter_batch(_scale, [(i,) for i in range(8)])
+            assert next(results) == 0
+
+            assert second.worker_pool is not first.worker_pool
+            assert second.execute(_scale, 1) == 2
+            assert second.execute_batch(_scale, [(1,), (2,)]) == [2, 4]
+            assert list(results) == [i * 2 for i in range(1, 8)]
+
+    def test_shutdown_all_releases_pools_for_reuse(self):
+        """Test that handlers keep working on fresh pools after shutdown_all."""
+        handler = ExecutionHandler(n_workers=2)
+        assert handler.execute(_scale, 1) == 2
+        old_pool = handler.worker_pool
+
+        shutdown_all()
+
+        assert handler.worker_pool is not old_pool
+        assert handler.execute_batch(_scale, [(i,) for i in range(4)]) == [0, 2, 4, 6]
+        new_pool = handler.worker_pool
+        handler.close()
+        assert ExecutionHandler(n_workers=2).worker_pool is new_pool
+
+    def test_zero_workers_runs_inline_without_pool(self):
+        """Test that n_workers=0 runs functions on the calling thread."""
+        handler = ExecutionHandler(n_workers=0)
+
+        assert handler.worker_pool is None
+        assert handler.execute(_scale, 3, factor=3) == 9
+        assert handler.execute_batch(_scale, [(1,), 2, {"x": 3, "factor": 5}]) == [
+            2,
+            4,
+            15,
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,9 @@
+import os
 import pytest
-from unittest.mock import Mock
 from src.core.memory_handler import MemoryConstrainedExecutionHandler
+from src.core.example_functions import read_file_to_string
+from src.core.memory_estimators import FileSizeMemoryEstimator, ListSizeMemoryEstimator
+from src.ports import MemoryCheckResult, MemoryInfo
 from tests.test_mocks import (
     MockMemoryMonitor,
     MockMemoryEstimator,
@@ -8,21 +11,130 @@ from tests.test_mocks import (
     MockExecutionDecision,
     ConfigurableMemoryEstimator,
 )
-from src.adapters import SafetyMarginMemoryPolicyAdapter, FixedMemoryEstimatorAdapter
+from src.adapters import (
+    CustomMemoryEstimatorAdapter,
+    LoggerExecutionDecisionAdapter,
+    PsutilMemoryMonitorAdapter,
+    SafetyMarginMemoryPolicyAdapter,
+    FileSizeMemoryEstimatorAdapter,
+    DataSizeMemoryEstimatorAdapter,
+    FixedMemoryEstimatorAdapter,
+)
+
+
+# Byte sizes used throughout the tests
+_KB, _MB, _GB = 1024, 1024**2, 1024**3
+_SAFE_8GB_80 = int(8 * _GB * 0.8)  # 8GB with a 20% safety margin
+
+
+def _double(x):
+    return x * 2
+
+
+@pytest.fixture(scope="module")
+def safety_policy():
+    """Safety margin policy with a 10% margin, stateless so shared by the module."""
+    return SafetyMarginMemoryPolicyAdapter(safety_margin=0.1)
+
+
+@pytest.fixture(scope="module")
+def strict_safety_policy():
+    """Safety margin policy with a 20% margin, stateless so shared by the module."""
+    return SafetyMarginMemoryPolicyAdapter(safety_margin=0.2)
+
+
+@pytest.fixture(scope="module")
+def fixed_estimator():
+    """Fixed 5MB memory estimator, stateless so shared by the module."""
+    return FixedMemoryEstimatorAdapter(5 * _MB)
+
+
+@pytest.fixture
+def execution_decision():
+    """Recording mock execution decision, fresh for every test."""
+    return MockExecutionDecision(record_logs=True)
+
+
+def _make_handler(available: int, policy_ok: bool):
+    """Build an inline handler over mock ports, returning it with its mocks."""
+    memory_policy = MockMemoryPolicy(should_execute=policy_ok)
+    execution_decision = MockExecutionDecision(record_logs=True)
+    handler = MemoryConstrainedExecutionHandler(
+        n_workers=0,
+        memory_monitor=MockMemoryMonitor(available_memory=available),
+        memory_policy=memory_policy,
+        execution_decision=execution_decision,
+    )
+    return handler, memory_policy, execution_decision
 
 
 class TestMemoryConstrainedExecutionHandler:
     """Test suite for MemoryConstrainedExecutionHandler with ports and adapters."""
 
-    def test_accepts_work_when_memory_available(self):
-        """Test that handler accepts work when sufficient memory is available."""
+    @pytest.mark.parametrize(
+        "available,estimate,policy_ok,expected,raises",
+        [
+            pytest.param(8 * _GB, _MB, True, 10, False, id="accepts"),
+            pytest.param(_MB, 2 * _MB, False, None, True, id="refuses"),
+            pytest.param(8 * _GB, None, True, 10, False, id="no_estimator"),
+        ],
+    )
+    def test_memory_checked_execution(
+        self, available, estimate, policy_ok, expected, raises
+    ):
+        """Test that single execution runs, refuses or skips the memory check."""
         # Arrange
-        memory_monitor = MockMemoryMonitor(
-            available_memory=8 * 1024**3
-        )  # 8GB available
-        memory_estimator = MockMemoryEstimator(fixed_estimate=1024**2)  # 1MB estimate
-        memory_policy = MockMemoryPolicy(should_execute=True)
-        execution_decision = MockExecutionDecision()
+        handler, memory_policy, execution_decision = _make_handler(available, policy_ok)
+        memory_estimator = (
+            MockMemoryEstimator(fixed_estimate=estimate)
+            if estimate is not None
+            else None
+        )
+
+        # Act
+        if raises:
+            with pytest.raises(MemoryError, match="Insufficient memory"):
+                handler.execute_with_memory_check(_double, memory_estimator, 5)
+        else:
+            result = handler.execute_with_memory_check(_double, memory_estimator, 5)
+
+        # Assert
+        if memory_estimator is None:
+            # No memory check should have been performed
+            assert memory_policy.get_decision_count() == 0
+            assert execution_decision.get_memory_check_logs() == []
+        else:
+            assert memory_estimator.get_call_count() == 1
+            assert memory_policy.get_decision_count() == 1
+
+        if raises:
+            # Verify error was logged with the estimate and available memory
+            assert execution_decision.get_memory_error_logs() == [(estimate, available)]
+        else:
+            assert result == expected
+            # Verify execution was logged
+            assert execution_decision.get_execution_decision_logs() == [
+                ("_double", True, "")
+            ]
+
+    def test_batch_execution_with_mixed_results(self, execution_decision):
+        """Test batch execution with some tasks succeeding and others failing."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=4 * _MB)  # 4MB available
+
+        # Configure estimator to return different estimates for different calls
+        estimator = ConfigurableMemoryEstimator()
+        estimator.set_estimates([_MB, 2 * _MB, _MB])  # 1MB, 2MB, 1MB
+
+        # Policy that allows 1MB but not 2MB
+        class _Policy:
+            def should_execute(self, check):
+                return check.estimated_usage <= 1.5 * _MB
+
+            def get_safe_available_memory(self, available_memory):
+                return available_memory
+
+        memory_policy = _Policy()
 
         handler = MemoryConstrainedExecutionHandler(
             n_workers=1,
@@ -31,119 +143,197 @@ class TestMemoryConstrainedExecutionHandler:
             execution_decision=execution_decision,
         )
 
-        def test_function(x):
-            return x * 2
-
         # Act
-        result = handler.execute_with_memory_check(test_function, memory_estimator, 5)
+        results = handler.execute_batch_with_memory_check(
+            _double, [(1,), (2,), (3,)], estimator
+        )
 
         # Assert
-        assert result == 10
-        assert memory_estimator.get_call_count() == 1
-        assert memory_policy.get_decision_count() == 1
-        assert len(execution_decision.get_execution_decision_logs()) == 1
+        assert results == [
+            2,
+            None,
+            6,
+        ]  # Second task should be None due to memory constraint
+        assert estimator.get_call_count() == 3
 
-        # Verify execution was logged
+        # Verify execution decisions were logged
         decision_logs = execution_decision.get_execution_decision_logs()
-        assert decision_logs[0][0] == "test_function"
-        assert decision_logs[0][1]
+        assert len(decision_logs) >= 3  # At least 3 individual decisions
 
-    def test_refuses_work_when_memory_insufficient(self):
-        """Test that handler refuses work when memory is insufficient."""
+    def test_batch_reuses_admission_decision_for_identical_checks(self):
+        """Test that identical checks within a batch consult the policy once."""
         # Arrange
-        memory_monitor = MockMemoryMonitor(available_memory=1024**2)  # 1MB available
-        memory_estimator = MockMemoryEstimator(
-            fixed_estimate=2 * 1024**2
-        )  # 2MB estimate
-        memory_policy = MockMemoryPolicy(should_execute=False)  # Policy says no
-        execution_decision = MockExecutionDecision()
+        memory_monitor = MockMemoryMonitor(available_memory=8 * _GB)
+        memory_estimator = MockMemoryEstimator(fixed_estimate=_MB)
+        memory_policy = MockMemoryPolicy(should_execute=True)
 
         handler = MemoryConstrainedExecutionHandler(
-            n_workers=1,
+            n_workers=0,
             memory_monitor=memory_monitor,
             memory_policy=memory_policy,
-            execution_decision=execution_decision,
+            execution_decision=MockExecutionDecision(),
         )
 
-        def test_function(x):
-            return x * 2
-
-        # Act & Assert
-        with pytest.raises(MemoryError, match="Insufficient memory"):
-            handler.execute_with_memory_check(test_function, memory_estimator, 5)
+        # Act
+        results = handler.execute_batch_with_memory_check(
+            _double, [(1,), (2,), (3,)], memory_estimator
+        )
 
-        # Verify memory check was performed
-        assert memory_estimator.get_call_count() == 1
+        # Assert
+        assert results == [2, 4, 6]
+        assert memory_estimator.get_call_count() == 3
         assert memory_policy.get_decision_count() == 1
 
-        # Verify error was logged
-        error_logs = execution_decision.get_memory_error_logs()
-        assert len(error_logs) == 1
-        assert error_logs[0][0] == 2 * 1024**2  # 2MB estimate
-        assert error_logs[0][1] == 1024**2  # 1MB available
+    def test_batch_evaluates_policy_once_per_snapshot(self):
+        """Test that identical batch tasks run one fused policy evaluation."""
 
-    def test_batch_execution_with_mixed_results(self):
-        """Test batch execution with some tasks succeeding and others failing."""
         # Arrange
-        memory_monitor = MockMemoryMonitor(
-            available_memory=4 * 1024**2
-        )  # 4MB available
+        class CountingPolicy(SafetyMarginMemoryPolicyAdapter):
+            evaluate_calls = 0
 
-        # Configure estimator to return different estimates for different calls
-        estimator = ConfigurableMemoryEstimator()
-        estimator.set_estimates([1024**2, 2 * 1024**2, 1024**2])  # 1MB, 2MB, 1MB
+            def evaluate(self, estimated_usage, memory_info):
+                CountingPolicy.evaluate_calls += 1
+                return super().evaluate(estimated_usage, memory_info)
 
-        # Policy that allows 1MB but not 2MB
-        def policy_should_execute(estimated_usage, available_memory):
-            return estimated_usage <= 1.5 * 1024**2
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=MockMemoryMonitor(available_memory=8 * _GB),
+            memory_policy=CountingPolicy(),
+            execution_decision=MockExecutionDecision(),
+        )
 
-        memory_policy = Mock()
-        memory_policy.should_execute = policy_should_execute
-        memory_policy.get_safe_available_memory = lambda x: x
+        # Act
+        results = handler.execute_batch_with_memory_check(
+            _double, [(1,), (2,), (3,)], MockMemoryEstimator()
+        )
 
-        execution_decision = MockExecutionDecision()
+        # Assert
+        assert results == [2, 4, 6]
+        assert CountingPolicy.evaluate_calls == 1
+
+    def test_large_batch_uses_fast_admission(self, safety_policy, execution_decision):
+        """Test that large batches with simple estimators admit without per-task checks."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=10 * _MB)  # 10MB
+        estimator = DataSizeMemoryEstimatorAdapter(multiplier=1.5)
 
         handler = MemoryConstrainedExecutionHandler(
-            n_workers=1,
+            n_workers=0,
             memory_monitor=memory_monitor,
-            memory_policy=memory_policy,
+            memory_policy=safety_policy,  # 9MB safe
             execution_decision=execution_decision,
         )
+        n_tasks = MemoryConstrainedExecutionHandler.fast_admission_threshold
+        # Alternate 1MB tasks (1.5MB estimate) and 8MB tasks (12MB estimate)
+        sizes = [_MB if i % 2 == 0 else 8 * _MB for i in range(n_tasks)]
 
-        def test_function(x):
-            return x * 2
+        # Act
+        results = handler.execute_batch_with_memory_check(
+            _double, [(size,) for size in sizes], estimator
+        )
+
+        # Assert
+        assert results == [size * 2 if size == _MB else None for size in sizes]
+        # A single memory check for the largest task, per-task logs for refusals
+        assert execution_decision.get_memory_check_logs() == [
+            MemoryCheckResult(12 * _MB, 10 * _MB, 9 * _MB, 8 * _GB)
+        ]
+        assert execution_decision.get_memory_error_logs() == [(12 * _MB, 10 * _MB)] * (
+            n_tasks // 2
+        )
+        refusal = (
+            "_double",
+            False,
+            "Insufficient memory: estimated 12MB exceeds available memory",
+        )
+        assert execution_decision.get_execution_decision_logs() == [refusal] * (
+            n_tasks // 2
+        ) + [
+            (
+                "batch__double",
+                False,
+                f"Skipped {n_tasks // 2} out of {n_tasks} executions due to memory constraints",
+            )
+        ]
+
+    def test_large_batch_uses_subclass_estimates(self, safety_policy):
+        """Test that estimator subclasses keep their own estimate in large batches."""
+
+        # Arrange
+        class DoublingEstimator(DataSizeMemoryEstimatorAdapter):
+            def estimate_memory_usage(self, data_size, *args, **kwargs):
+                return 2 * data_size
+
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=MockMemoryMonitor(available_memory=10 * _MB),
+            memory_policy=safety_policy,  # 9MB safe
+            execution_decision=MockExecutionDecision(),
+        )
+        n_tasks = MemoryConstrainedExecutionHandler.fast_admission_threshold
+        # 5MB tasks pass a 1.5x estimate (7.5MB) but not a 2x one (10MB)
+        args_list = [(5 * _MB,)] * n_tasks
 
         # Act
         results = handler.execute_batch_with_memory_check(
-            test_function, [(1,), (2,), (3,)], estimator
+            _double, args_list, DoublingEstimator()
         )
 
         # Assert
-        assert results == [
-            2,
-            None,
-            6,
-        ]  # Second task should be None due to memory constraint
-        assert estimator.get_call_count() == 3
+        assert results == [None] * n_tasks
 
-        # Verify execution decisions were logged
-        decision_logs = execution_decision.get_execution_decision_logs()
-        assert len(decision_logs) >= 3  # At least 3 individual decisions
+    @pytest.mark.parametrize("policy_ok", [True, False], ids=["admits", "refuses"])
+    def test_float_estimates_are_logged(self, policy_ok):
+        """Test that fractional estimates pass through checks and logging."""
+        # Arrange
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=MockMemoryMonitor(available_memory=8 * _GB),
+            memory_policy=MockMemoryPolicy(should_execute=policy_ok),
+            execution_decision=LoggerExecutionDecisionAdapter(),
+        )
+        memory_estimator = CustomMemoryEstimatorAdapter(lambda *args: 1.5 * _MB)
+
+        # Act / Assert
+        if policy_ok:
+            assert handler.execute_with_memory_check(_double, memory_estimator, 3) == 6
+        else:
+            with pytest.raises(MemoryError, match="estimated 1MB"):
+                handler.execute_with_memory_check(_double, memory_estimator, 3)
 
-    def test_memory_info_uses_ports(self):
+    def test_default_adapters_are_built_per_handler(self):
+        """Test that handlers get their own default adapters."""
+        # Arrange
+        custom_policy = SafetyMarginMemoryPolicyAdapter(safety_margin=0.2)
+
+        # Act
+        first = MemoryConstrainedExecutionHandler(n_workers=0)
+        second = MemoryConstrainedExecutionHandler(n_workers=0)
+        custom = MemoryConstrainedExecutionHandler(
+            n_workers=0, memory_policy=custom_policy
+        )
+        first.memory_policy.safety_margin = 0.5
+
+        # Assert
+        assert second.memory_policy.safety_margin == 0.1
+        assert first.memory_monitor is not second.memory_monitor
+        assert first.memory_monitor.policy is first.memory_policy
+        assert custom.memory_monitor.policy is custom_policy
+        assert isinstance(first.execution_decision, LoggerExecutionDecisionAdapter)
+
+    def test_memory_info_uses_ports(self, strict_safety_policy):
         """Test that get_memory_info uses the injected ports."""
         # Arrange
         memory_monitor = MockMemoryMonitor(
-            total_memory=16 * 1024**3,  # 16GB total
-            available_memory=8 * 1024**3,  # 8GB available
+            total_memory=16 * _GB,  # 16GB total
+            available_memory=8 * _GB,  # 8GB available
         )
-        memory_policy = SafetyMarginMemoryPolicyAdapter(safety_margin=0.2)  # 20% margin
         execution_decision = MockExecutionDecision()
 
         handler = MemoryConstrainedExecutionHandler(
-            n_workers=1,
+            n_workers=0,
             memory_monitor=memory_monitor,
-            memory_policy=memory_policy,
+            memory_policy=strict_safety_policy,  # 20% margin
             execution_decision=execution_decision,
         )
 
@@ -151,118 +341,422 @@ class TestMemoryConstrainedExecutionHandler:
         memory_info = handler.get_memory_info()
 
         # Assert
-        assert memory_info["total"] == 16 * 1024**3
-        assert memory_info["available"] == 8 * 1024**3
-        assert memory_info["safe_available"] == int(8 * 1024**3 * 0.8)  # 20% margin
+        assert memory_info["total"] == 16 * _GB
+        assert memory_info["available"] == 8 * _GB
+        assert memory_info["safe_available"] == _SAFE_8GB_80  # 20% margin
+
+    def test_small_tasks_skip_check_with_ample_memory(
+        self, safety_policy, execution_decision
+    ):
+        """Test that tiny tasks skip the full check under a safety margin policy."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=8 * _GB)
+        memory_estimator = MockMemoryEstimator(fixed_estimate=_MB)
+
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=memory_monitor,
+            memory_policy=safety_policy,
+            execution_decision=execution_decision,
+        )
+
+        # Act
+        first = handler.execute_with_memory_check(_double, memory_estimator, 1)
+        second = handler.execute_with_memory_check(_double, memory_estimator, 2)
+
+        # Assert
+        assert (first, second) == (2, 4)
+        assert memory_estimator.get_call_count() == 2
+        assert execution_decision.get_memory_check_logs() == []
 
-    def test_execution_without_memory_estimator(self):
-        """Test execution when no memory estimator is provided."""
+    def test_refused_task_stays_refused_on_retry(self):
+        """Test that a policy refusal is not bypassed by an immediate retry."""
         # Arrange
-        memory_monitor = MockMemoryMonitor(available_memory=8 * 1024**3)
-        memory_policy = MockMemoryPolicy(should_execute=True)
-        execution_decision = MockExecutionDecision()
+        handler, memory_policy, execution_decision = _make_handler(
+            1000 * _MB, policy_ok=False
+        )
+        memory_estimator = MockMemoryEstimator(fixed_estimate=_MB)
+
+        # Act
+        for attempt in (1, 2):
+            with pytest.raises(MemoryError, match="Insufficient memory"):
+                handler.execute_with_memory_check(_double, memory_estimator, attempt)
+
+        # Assert
+        assert memory_policy.get_decision_count() == 2
+        assert len(execution_decision.get_memory_error_logs()) == 2
+
+    def test_single_calls_follow_policy_changes(self):
+        """Test that each single execution asks a stateful policy again."""
+        # Arrange
+        handler, memory_policy, _ = _make_handler(8 * _GB, policy_ok=True)
+        memory_estimator = MockMemoryEstimator(fixed_estimate=_MB)
+
+        # Act
+        result = handler.execute_with_memory_check(_double, memory_estimator, 1)
+        memory_policy.set_should_execute(False)
 
+        # Assert
+        assert result == 2
+        with pytest.raises(MemoryError, match="Insufficient memory"):
+            handler.execute_with_memory_check(_double, memory_estimator, 2)
+        assert memory_policy.get_decision_count() == 2
+
+    def test_memory_drop_is_seen_by_next_task(self, safety_policy):
+        """Test that a task is checked against memory read after a drop."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=1000 * _MB)
+        memory_estimator = MockMemoryEstimator(fixed_estimate=_MB)
         handler = MemoryConstrainedExecutionHandler(
-            n_workers=1,
+            n_workers=0,
             memory_monitor=memory_monitor,
-            memory_policy=memory_policy,
+            memory_policy=safety_policy,
+            execution_decision=MockExecutionDecision(),
+        )
+
+        # Act
+        result = handler.execute_with_memory_check(_double, memory_estimator, 1)
+        memory_monitor.set_available_memory(5 * _MB)
+        memory_estimator.set_estimate(10 * _MB)
+
+        # Assert
+        assert result == 2
+        with pytest.raises(MemoryError, match="Insufficient memory"):
+            handler.execute_with_memory_check(_double, memory_estimator, 2)
+
+    def test_safety_policy_admits_then_refuses_single_calls(
+        self, safety_policy, execution_decision
+    ):
+        """Test that single calls past the short-circuit are admitted or refused."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=8 * _GB)
+        # Too large to skip the full check against the 7.2GB safe available
+        memory_estimator = MockMemoryEstimator(fixed_estimate=2 * _GB)
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=memory_monitor,
+            memory_policy=safety_policy,
             execution_decision=execution_decision,
         )
 
-        def test_function(x):
-            return x * 3
+        # Act
+        result = handler.execute_with_memory_check(_double, memory_estimator, 5)
+        memory_estimator.set_estimate(16 * _GB)
+        with pytest.raises(MemoryError, match="Insufficient memory"):
+            handler.execute_with_memory_check(_double, memory_estimator, 5)
+
+        # Assert
+        assert result == 10
+        assert execution_decision.get_execution_decision_logs() == [
+            ("_double", True, "")
+        ]
+        assert len(execution_decision.get_memory_error_logs()) == 1
+
+    def test_estimate_passed_to_functions_accepting_size_hint(self):
+        """Test that the memory estimate is forwarded as `_estimated_size`."""
+        # Arrange
+        memory_monitor = MockMemoryMonitor(available_memory=8 * _GB)
+        memory_estimator = MockMemoryEstimator(fixed_estimate=3 * _MB)
+        handler = MemoryConstrainedExecutionHandler(
+            n_workers=0,
+            memory_monitor=memory_monitor,
+            memory_policy=MockMemoryPolicy(should_execute=True),
+            execution_decision=MockExecutionDecision(),
+        )
+
+        def sized_function(x, _estimated_size=None):
+            return x, _estimated_size
+
+        def plain_function(x):
+            return x
 
         # Act
-        result = handler.execute_with_memory_check(test_function, None, 4)
+        sized_result = handler.execute_with_memory_check(
+            sized_function, memory_estimator, 1
+        )
+        plain_result = handler.execute_with_memory_check(
+            plain_function, memory_estimator, 2
+        )
 
         # Assert
-        assert result == 12
-        # No memory check should have been performed
-        assert memory_policy.get_decision_count() == 0
-        assert len(execution_decision.get_memory_check_logs()) == 0
+        assert sized_result == (1, 3 * _MB)
+        assert plain_result == 2
+
+    def test_read_file_mmap_matches_buffered_read(self, tmp_path):
+        """Test that mapped and buffered file reads return the same text."""
+        # Arrange
+        test_file = tmp_path / "data.txt"
+        test_file.write_bytes("línea\r\nzwei\rdrei\n".encode("utf-8"))
+        empty_file = tmp_path / "empty.txt"
+        empty_file.write_bytes(b"")
+
+        # Act
+        mapped = read_file_to_string(str(test_file))
+        buffered = read_file_to_string(str(test_file), use_mmap=False)
+        hinted = read_file_to_string(str(test_file), 4, use_mmap=False)
+        empty = read_file_to_string(str(empty_file))
+
+        # Assert
+        assert mapped == buffered == hinted == "línea\nzwei\ndrei\n"
+        assert empty == ""
+
+    @pytest.mark.skipif(not os.path.exists("/proc/version"), reason="requires procfs")
+    def test_read_file_mmap_reads_unmappable_files(self):
+        """Test that files reporting size 0, like procfs ones, are still read."""
+        # Arrange
+        with open("/proc/version", encoding="utf-8") as file:
+            expected = file.read()
 
-    def test_safety_margin_policy_adapter(self):
+        # Act
+        content = read_file_to_string("/proc/version")
+
+        # Assert
+        assert content == expected != ""
+
+    def test_safety_margin_policy_adapter(self, safety_policy):
         """Test the safety margin policy adapter."""
         # Arrange
-        policy = SafetyMarginMemoryPolicyAdapter(safety_margin=0.1)  # 10% margin
-        available_memory = 10 * 1024**2  # 10MB
+        policy = safety_policy  # 10% margin
+        available_memory = 10 * _MB  # 10MB
 
         # Act
         safe_available = policy.get_safe_available_memory(available_memory)
         should_execute_small = policy.should_execute(
-            8 * 1024**2, available_memory
+            MemoryCheckResult(8 * _MB, available_memory, safe_available, 0)
         )  # 8MB
         should_execute_large = policy.should_execute(
-            9.5 * 1024**2, available_memory
+            MemoryCheckResult(9.5 * _MB, available_memory, safe_available, 0)
         )  # 9.5MB
 
         # Assert
-        assert safe_available == int(10 * 1024**2 * 0.9)  # 9MB
+        assert safe_available == int(10 * _MB * 0.9)  # 9MB
         assert should_execute_small  # 8MB < 9MB
         assert not should_execute_large  # 9.5MB > 9MB
 
-    def test_fixed_memory_estimator_adapter(self):
+    def test_safety_margin_policy_follows_margin_updates(self):
+        """Test that changing the safety margin changes later decisions."""
+        # Arrange
+        policy = SafetyMarginMemoryPolicyAdapter(safety_margin=0.1)
+
+        # Act
+        policy.safety_margin = 0.5
+
+        # Assert
+        assert policy.safety_margin == 0.5
+        assert policy.get_safe_available_memory(100) == 50
+        assert not policy.should_execute(MemoryCheckResult(60, 100, 50, 0))
+
+    def test_safety_margin_evaluate_matches_separate_steps(self, safety_policy):
+        """Test that the fused evaluation agrees with the separate policy steps."""
+        # Arrange
+        policy = safety_policy
+        memory_info = MemoryInfo(
+            total=16 * _MB,
+            available=10 * _MB,
+            used=6 * _MB,
+            percent=37.5,
+            safe_available=10 * _MB,
+        )
+
+        for estimated_usage in (_MB, 9 * _MB, 9 * _MB + 1):
+            # Act
+            should_execute, check = policy.evaluate(estimated_usage, memory_info)
+
+            # Assert
+            assert check == MemoryCheckResult(
+                estimated_usage,
+                memory_info.available,
+                policy.get_safe_available_memory(memory_info.available),
+                memory_info.total,
+            )
+            assert should_execute == policy.should_execute(check)
+
+    def test_safety_margin_policy_admits_exact_boundary(self, strict_safety_policy):
+        """Test that an estimate equal to the safe available memory is admitted."""
+        # Arrange
+        policy = strict_safety_policy  # 20% margin
+        available_memory = 10 * _MB  # 10MB
+        safe_available = policy.get_safe_available_memory(available_memory)
+
+        # Act
+        should_execute_exact = policy.should_execute(
+            MemoryCheckResult(safe_available, available_memory, safe_available, 0)
+        )
+        should_execute_over = policy.should_execute(
+            MemoryCheckResult(safe_available + 1, available_memory, safe_available, 0)
+        )
+
+        # Assert
+        assert safe_available == 8 * _MB  # Exactly 8MB, no float rounding
+        assert should_execute_exact
+        assert not should_execute_over
+
+    def test_fixed_memory_estimator_adapter(self, fixed_estimator):
         """Test the fixed memory estimator adapter."""
         # Arrange
-        estimator = FixedMemoryEstimatorAdapter(5 * 1024**2)  # 5MB
+        estimator = fixed_estimator  # 5MB
 
         # Act
         estimate1 = estimator.estimate_memory_usage("file1.txt")
         estimate2 = estimator.estimate_memory_usage("file2.txt", arg2="value")
 
         # Assert
-        assert estimate1 == 5 * 1024**2
-        assert estimate2 == 5 * 1024**2
+        assert estimate1 == 5 * _MB
+        assert estimate2 == 5 * _MB
+
+    def test_batch_estimates_match_per_task_estimates(self, tmp_path):
+        """Test that batch estimation agrees with estimating each task."""
+        # Arrange
+        test_file = tmp_path / "data.txt"
+        test_file.write_bytes(b"x" * _KB)
+        cases = [
+            (DataSizeMemoryEstimatorAdapter(), [(1,), (1000,), (3 * _MB,)]),
+            (FixedMemoryEstimatorAdapter(fixed_amount=64), [(1,), (2,)]),
+            (
+                FileSizeMemoryEstimatorAdapter(multiplier=1.5),
+                [(str(test_file),), (str(tmp_path / "missing"),)],
+            ),
+            (ListSizeMemoryEstimator(bytes_per_item=8), [(10,), (0,)]),
+            (
+                FileSizeMemoryEstimator(),
+                [(str(test_file),), (str(test_file),), (str(tmp_path / "gone"),)],
+            ),
+            (MockMemoryEstimator(fixed_estimate=5), [(1,), (2,)]),
+        ]
+
+        for estimator, args_list in cases:
+            # Act
+            batch = estimator.estimate_memory_usage_batch(args_list)
+
+            # Assert
+            assert batch == [
+                estimator.estimate_memory_usage(*args) for args in args_list
+            ]
+
+    def test_file_size_estimator_adapter_caches_sizes(self, tmp_path):
+        """Test that the file size estimator stats each path only once."""
+        # Arrange
+        test_file = tmp_path / "data.txt"
+        test_file.write_bytes(b"x" * _KB)
+        estimator = FileSizeMemoryEstimatorAdapter(multiplier=2.0)
+
+        # Act
+        first_estimate = estimator.estimate_memory_usage(str(test_file))
+        test_file.write_bytes(b"x" * 4096)
+        second_estimate = estimator.estimate_memory_usage(str(test_file))
+        estimator.clear_cache()
+        cleared_estimate = estimator.estimate_memory_usage(str(test_file))
+        missing_estimate = estimator.estimate_memory_usage(str(tmp_path / "missing"))
+
+        # Assert
+        assert first_estimate == 2 * _KB
+        assert second_estimate == first_estimate  # Cached size is reused
+        assert cleared_estimate == 2 * 4096
+        assert missing_estimate == 0
+
+    def test_file_size_estimator_caches_sizes(self, tmp_path):
+        """Test that the core file size estimator caches sizes per estimator."""
+        # Arrange
+        test_file = tmp_path / "data.txt"
+        test_file.write_bytes(b"x" * _KB)
+        estimator = FileSizeMemoryEstimator(multiplier=2.0)
+
+        # Act
+        first_estimate = estimator.estimate_memory_usage(str(test_file))
+        test_file.write_bytes(b"x" * 4096)
+        cached_estimate = estimator.estimate_memory_usage(str(test_file))
+        other_estimate = FileSizeMemoryEstimator(multiplier=1.0).estimate_memory_usage(
+            str(test_file)
+        )
+        estimator.clear_cache()
+        cleared_estimate = estimator.estimate_memory_usage(str(test_file))
+        missing_estimate = estimator.estimate_memory_usage(str(tmp_path / "missing"))
+
+        # Assert
+        assert first_estimate == cached_estimate == 2 * _KB
+        assert other_estimate == 4096  # Not shared between estimators
+        assert cleared_estimate == 2 * 4096
+        assert missing_estimate == 0
+
+    def test_psutil_monitor_reuses_snapshot_within_ttl(self):
+        """Test that the psutil monitor reuses its snapshot until the TTL expires."""
+        # Arrange
+        cached_monitor = PsutilMemoryMonitorAdapter(ttl=60.0)
+        uncached_monitor = PsutilMemoryMonitorAdapter(ttl=0.0)
+
+        # Act
+        first = cached_monitor.get_memory_info()
+        second = cached_monitor.get_memory_info()
+
+        # Assert
+        assert first is second
+        assert cached_monitor.get_available_memory() == first.available
+        assert cached_monitor.get_total_memory() == first.total
+        assert (
+            uncached_monitor.get_memory_info() is not uncached_monitor.get_memory_info()
+        )
+
+    def test_psutil_monitor_applies_policy_to_safe_available(
+        self, strict_safety_policy
+    ):
+        """Test that the psutil monitor fills safe_available from its policy."""
+        # Arrange
+        policy = strict_safety_policy  # 20% margin
+        monitor = PsutilMemoryMonitorAdapter(ttl=60.0, policy=policy)
+
+        # Act
+        memory_info = monitor.get_memory_info()
+
+        # Assert
+        assert memory_info.safe_available == policy.get_safe_available_memory(
+            memory_info.available
+        )
 
     def test_mock_memory_monitor_configuration(self):
         """Test that mock memory monitor can be configured dynamically."""
         # Arrange
-        monitor = MockMemoryMonitor(
-            total_memory=8 * 1024**3, available_memory=4 * 1024**3
-        )
+        monitor = MockMemoryMonitor(total_memory=8 * _GB, available_memory=4 * _GB)
 
         # Act
         initial_available = monitor.get_available_memory()
-        monitor.set_available_memory(2 * 1024**3)  # Reduce to 2GB
+        monitor.set_available_memory(2 * _GB)  # Reduce to 2GB
         updated_available = monitor.get_available_memory()
 
         # Assert
-        assert initial_available == 4 * 1024**3
-        assert updated_available == 2 * 1024**3
+        assert initial_available == 4 * _GB
+        assert updated_available == 2 * _GB
 
         memory_info = monitor.get_memory_info()
-        assert memory_info.available == 2 * 1024**3
-        assert memory_info.used == 6 * 1024**3  # 8GB - 2GB
+        assert memory_info.available == 2 * _GB
+        assert memory_info.used == 6 * _GB  # 8GB - 2GB
 
     def test_mock_execution_decision_logging(self):
         """Test that mock execution decision captures all logging."""
         # Arrange
-        decision = MockExecutionDecision()
+        decision = MockExecutionDecision(record_logs=True)
 
         # Act
-        decision.log_memory_check(1024**2, 8 * 1024**2, 7 * 1024**2)
+        check = MemoryCheckResult(_MB, 8 * _MB, 7 * _MB, 16 * _MB)
+        decision.log_memory_check(check)
         decision.log_execution_decision("test_func", True, "sufficient memory")
-        decision.log_memory_error(2 * 1024**2, 1024**2)
+        decision.log_memory_error(2 * _MB, _MB)
 
         # Assert
         memory_logs = decision.get_memory_check_logs()
         execution_logs = decision.get_execution_decision_logs()
         error_logs = decision.get_memory_error_logs()
 
-        assert len(memory_logs) == 1
-        assert memory_logs[0] == (1024**2, 8 * 1024**2, 7 * 1024**2)
-
-        assert len(execution_logs) == 1
-        assert execution_logs[0] == ("test_func", True, "sufficient memory")
-
-        assert len(error_logs) == 1
-        assert error_logs[0] == (2 * 1024**2, 1024**2)
+        assert memory_logs == [check]
+        assert execution_logs == [("test_func", True, "sufficient memory")]
+        assert error_logs == [(2 * _MB, _MB)]
 
         # Test clearing logs
         decision.clear_logs()
-        assert len(decision.get_memory_check_logs()) == 0
-        assert len(decision.get_execution_decision_logs()) == 0
-        assert len(decision.get_memory_error_logs()) == 0
+        assert (
+            decision.get_memory_check_logs(),
+            decision.get_execution_decision_logs(),
+            decision.get_memory_error_logs(),
+        ) == ([], [], [])
 
 
 if __name__ == "__main__":
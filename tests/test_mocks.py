@@ -5,6 +5,7 @@ from src.ports import (
     MemoryPolicyPort,
     ExecutionDecisionPort,
     MemoryInfo,
+    MemoryCheckResult,
 )
 
 
@@ -66,7 +67,12 @@ class MockMemoryEstimator(MemoryEstimatorPort):
         self._call_history: List[tuple] = []
 
     def set_estimate(self, estimate: int) -> None:
-        """Set fixed memory estimate for testing."""
+        """
+        Set fixed memory estimate for testing.
+
+        Prefer reusing one estimator and calling this between scenarios over
+        constructing a new estimator per iteration.
+        """
         self._fixed_estimate = estimate
 
     def estimate_memory_usage(self, *args, **kwargs) -> int:
@@ -104,10 +110,10 @@ class MockMemoryPolicy(MemoryPolicyPort):
         """Set whether operations should execute."""
         self._should_execute = should_execute
 
-    def should_execute(self, estimated_usage: int, available_memory: int) -> bool:
+    def should_execute(self, check: MemoryCheckResult) -> bool:
         """Return configured execution decision and record call."""
         self._decision_count += 1
-        self._decision_history.append((estimated_usage, available_memory))
+        self._decision_history.append((check.estimated_usage, check.available))
         return self._should_execute
 
     def get_safe_available_memory(self, total_available: int) -> int:
@@ -126,30 +132,37 @@ class MockMemoryPolicy(MemoryPolicyPort):
 class MockExecutionDecision(ExecutionDecisionPort):
     """Mock execution decision logger for testing."""
 
-    def __init__(self):
+    def __init__(self, record_logs: bool = False):
+        """
+        Initialize mock execution decision logger.
+
+        Args:
+            record_logs: Whether to record log calls; tests that inspect the
+                logs opt in so batch runs don't pay for list appends
+        """
+        self.record_logs = record_logs
         self._memory_check_logs: List[tuple] = []
         self._execution_decision_logs: List[tuple] = []
         self._memory_error_logs: List[tuple] = []
 
-    def log_memory_check(
-        self, estimated_usage: int, available_memory: int, safe_available: int
-    ) -> None:
+    def log_memory_check(self, check: MemoryCheckResult) -> None:
         """Record memory check log."""
-        self._memory_check_logs.append(
-            (estimated_usage, available_memory, safe_available)
-        )
+        if self.record_logs:
+            self._memory_check_logs.append(check)
 
     def log_execution_decision(
         self, func_name: str, should_execute: bool, reason: str = ""
     ) -> None:
         """Record execution decision log."""
-        self._execution_decision_logs.append((func_name, should_execute, reason))
+        if self.record_logs:
+            self._execution_decision_logs.append((func_name, should_execute, reason))
 
     def log_memory_error(self, estimated_usage: int, available_memory: int) -> None:
         """Record memory error log."""
-        self._memory_error_logs.append((estimated_usage, available_memory))
+        if self.record_logs:
+            self._memory_error_logs.append((estimated_usage, available_memory))
 
-    def get_memory_check_logs(self) -> List[tuple]:
+    def get_memory_check_logs(self) -> List[MemoryCheckResult]:
         """Get memory check logs."""
         return self._memory_check_logs.copy()
 